@@ -0,0 +1,322 @@
+"""
+Benchmarks the solutions against synthetic inputs scaled well past the
+~20 KB puzzle inputs, so that solvers which only look fast on the real input
+show their asymptotic behaviour.
+
+Every generator writes an input in the same format as the day's puzzle input,
+sized at `scale` times the puzzle size, and reports the problem size N it used
+(lines, equations, grid cells, ...). Each (day, part, scale) is run through
+run.run_part, so timings and peak RSS are measured exactly like run.py does.
+
+Usage:
+    python bench.py                          # every generated day at scales 1, 10, 100
+    python bench.py 1 5 --scales 1,10,100,1000
+    python bench.py 7 --json bench_output.json --keep-inputs /tmp/aoc-bench
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from run import discover_parts, format_seconds, run_part
+
+LETTERS = 'wubrg'
+
+
+@dataclass
+class BenchResult:
+    day: str
+    part: str
+    scale: int
+    n: int
+    status: str
+    parse_time: Optional[float] = None
+    solve_time: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    throughput: Optional[float] = None  # N per second of solve time
+    message: str = ''
+
+
+def generate_day01(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Two columns of location IDs, 1000 lines at scale 1."""
+    n = 1000 * scale
+    ids = range(10000, 100000)
+    lines = [f'{rng.choice(ids)}   {rng.choice(ids)}' for _ in range(n)]
+    return '\n'.join(lines), n
+
+
+def generate_day02(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Reports of 5-8 levels, mostly monotonic with steps of 1-3, 1000 reports at scale 1."""
+    n = 1000 * scale
+    lines = []
+    for _ in range(n):
+        level = rng.randint(1, 90)
+        direction = rng.choice((-1, 1))
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-3, 5)
+            levels.append(levels[-1] + direction * step)
+        lines.append(' '.join(map(str, levels)))
+    return '\n'.join(lines), n
+
+
+def generate_day03(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Corrupted memory: 6 lines of ~3300 characters at scale 1 with mul/do/don't instructions."""
+    noise = "~!@#$%^&*()[]{}<>?;:,'+ whatfromselecthowwhowhere"
+    tokens = [lambda: f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})',
+              lambda: 'do()', lambda: "don't()", lambda: 'mul(4*', lambda: 'why()']
+    weights = (60, 6, 6, 4, 4)
+    lines = []
+    for _ in range(6 * scale):
+        parts = []
+        length = 0
+        while length < 3300:
+            if rng.random() < 0.3:
+                part = rng.choices(tokens, weights)[0]()
+            else:
+                part = ''.join(rng.choices(noise, k=rng.randint(1, 8)))
+            parts.append(part)
+            length += len(part)
+        lines.append(''.join(parts))
+    return '\n'.join(lines), sum(map(len, lines))
+
+
+def generate_day05(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """
+    Page ordering rules and updates, 1176 rules / 200 updates at scale 1.
+
+    Rules are all pairs of a random total order over the pages, so every
+    update has a consistent reordering.
+    """
+    rule_count = 1176 * scale
+    pages = max(2, round((1 + math.sqrt(1 + 8 * rule_count)) / 2))
+    order = rng.sample(range(10, 10 + 10 * pages), pages)
+    rank = {page: i for i, page in enumerate(order)}
+    rules = [(order[i], order[j]) for i in range(pages) for j in range(i + 1, pages)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(200 * scale):
+        update = rng.sample(order, min(pages, rng.randrange(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(','.join(map(str, update)))
+
+    text = '\n'.join(f'{x}|{y}' for x, y in rules) + '\n\n' + '\n'.join(updates)
+    return text, len(rules) + len(updates)
+
+
+def _guard_loop_obstacle(grid: List[List[str]], row: int, col: int) -> Optional[Tuple[int, int]]:
+    """
+    Walks the guard from (row, col) facing up. Returns None if it leaves the map, otherwise an
+    obstacle on the cycle it is trapped in.
+    """
+    side = len(grid)
+    steps = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    seen = bytearray(side * side)
+    direction, last_obstacle = 0, None
+    while True:
+        state = 1 << direction
+        cell = row * side + col
+        if seen[cell] & state:
+            return last_obstacle
+        seen[cell] |= state
+        next_row, next_col = row + steps[direction][0], col + steps[direction][1]
+        if not (0 <= next_row < side and 0 <= next_col < side):
+            return None
+        if grid[next_row][next_col] == '#':
+            last_obstacle = next_row, next_col
+            direction = (direction + 1) % 4
+        else:
+            row, col = next_row, next_col
+
+
+def generate_day06(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """
+    Guard map with ~5% obstacles, 130x130 cells at scale 1, guard facing up near the middle.
+    Obstacles that trap the guard in a cycle are cleared until the route leaves the map,
+    as it does in the puzzle.
+    """
+    side = round(130 * math.sqrt(scale))
+    grid = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+    start = side // 2
+    grid[start][start] = '^'
+    while (obstacle := _guard_loop_obstacle(grid, start, start)) is not None:
+        grid[obstacle[0]][obstacle[1]] = '.'
+    return '\n'.join(''.join(row) for row in grid), side * side
+
+
+def generate_day07(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Calibration equations with 3-12 operands, 850 equations at scale 1; about half are solvable."""
+    n = 850 * scale
+    lines = []
+    for _ in range(n):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.randrange(3)
+            target = target + number if op == 0 else target * number if op == 1 else int(f'{target}{number}')
+        if rng.random() < 0.5:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return '\n'.join(lines), n
+
+
+def generate_day10(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Topographic map of digits 0-9 along diagonal ramps with 10% noise, 57x57 at scale 1."""
+    side = round(57 * math.sqrt(scale))
+    rows = [''.join(str(rng.randrange(10) if rng.random() < 0.1 else (r + c) % 10) for c in range(side))
+            for r in range(side)]
+    return '\n'.join(rows), side * side
+
+
+def generate_day11(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Initial stones, 8 at scale 1."""
+    n = 8 * scale
+    return ' '.join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(n)), n
+
+
+def generate_day13(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Claw machines, 320 at scale 1; about half have a prize reachable with <= 100 presses."""
+    n = 320 * scale
+    machines = []
+    for _ in range(n):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f'Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}')
+    return '\n\n'.join(machines), n
+
+
+def generate_day14(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Robots on the 101x103 floor, 500 at scale 1."""
+    n = 500 * scale
+    lines = [f'p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}'
+             for _ in range(n)]
+    return '\n'.join(lines), n
+
+
+def generate_day19(rng: random.Random, scale: int) -> Tuple[str, int]:
+    """Towel patterns and designs, 447 towels / 400 designs at scale 1; most designs are buildable."""
+    towels = {''.join(rng.choices(LETTERS, k=rng.randint(1, 8))) for _ in range(447)}
+    towels.discard('u')  # without a plain 'u' towel some designs stay impossible
+    towel_list = sorted(towels)
+    n = 400 * scale
+    designs = []
+    for _ in range(n):
+        design, length = '', rng.randint(20, 60)
+        while len(design) < length:
+            design += rng.choice(towel_list) if rng.random() < 0.95 else rng.choice(LETTERS)
+        designs.append(design)
+    return ', '.join(towel_list) + '\n\n' + '\n'.join(designs), n
+
+
+GENERATORS: Dict[int, Callable[[random.Random, int], Tuple[str, int]]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    10: generate_day10,
+    11: generate_day11,
+    13: generate_day13,
+    14: generate_day14,
+    19: generate_day19,
+}
+
+
+def print_header() -> None:
+    header = (f"{'day':<6} {'part':<6} {'scale':>6} {'N':>10} {'parse':>12} {'solve':>12} "
+              f"{'peak RSS':>10} {'N/s':>12}")
+    print(header)
+    print('-' * len(header))
+
+
+def print_row(r: BenchResult) -> None:
+    if r.status != 'ok':
+        print(f'{r.day:<6} {r.part:<6} {r.scale:>6} {r.n:>10}  [{r.status}] {r.message}', flush=True)
+        return
+    throughput = '-' if r.throughput is None else f'{r.throughput:.0f}'
+    print(f'{r.day:<6} {r.part:<6} {r.scale:>6} {r.n:>10} {format_seconds(r.parse_time):>12} '
+          f'{format_seconds(r.solve_time):>12} {r.peak_rss_mb:>7.1f} MB {throughput:>12}', flush=True)
+
+
+def bench(days: List[int], parts: Optional[List[str]], scales: List[int], timeout: Optional[float],
+          input_dir: Path, seed: int) -> List[BenchResult]:
+    """
+    Generates the scaled inputs and runs every selected part on them.
+
+    Once a part fails or times out at some scale, its larger scales are skipped.
+
+    Returns:
+        List[BenchResult]: One result per (day, part, scale) that was attempted.
+    """
+    results = []
+    for day in days:
+        inputs = []
+        for scale in scales:
+            text, n = GENERATORS[day](random.Random(seed * 1000 + scale), scale)
+            path = input_dir / f'day{day:02d}_x{scale}.txt'
+            path.write_text(text)
+            inputs.append((scale, n, path))
+
+        for part_path in discover_parts([day], parts):
+            for scale, n, path in inputs:
+                run = run_part(part_path, path, timeout)
+                if run.status == 'skipped':
+                    break
+                result = BenchResult(run.day, run.part, scale, n, run.status, run.parse_time, run.solve_time,
+                                     run.peak_rss_mb, message=run.message)
+                if run.solve_time:
+                    result.throughput = n / run.solve_time
+                results.append(result)
+                print_row(result)
+                if run.status != 'ok':
+                    break
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the solutions on scaled synthetic inputs.')
+    parser.add_argument('days', nargs='*', type=int, help=f'day numbers to benchmark (default: {sorted(GENERATORS)})')
+    parser.add_argument('--part', action='append', help='part module to run, e.g. pt1 (repeatable)')
+    parser.add_argument('--scales', default='1,10,100', help='comma separated input scale factors (default: 1,10,100)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds allowed per run (default: 60)')
+    parser.add_argument('--seed', type=int, default=2024, help='random seed for the generators')
+    parser.add_argument('--keep-inputs', metavar='DIR', help='write the generated inputs here instead of a temp dir')
+    parser.add_argument('--json', metavar='PATH', help='also write the results as JSON')
+    args = parser.parse_args(argv)
+
+    days = args.days or sorted(GENERATORS)
+    unknown = [day for day in days if day not in GENERATORS]
+    if unknown:
+        parser.error(f'no input generator for day(s) {unknown}')
+    scales = [int(scale) for scale in args.scales.split(',')]
+
+    print_header()
+    if args.keep_inputs:
+        input_dir = Path(args.keep_inputs)
+        input_dir.mkdir(parents=True, exist_ok=True)
+        results = bench(days, args.part, scales, args.timeout, input_dir, args.seed)
+    else:
+        with tempfile.TemporaryDirectory(prefix='aoc-bench-') as tmp:
+            results = bench(days, args.part, scales, args.timeout, Path(tmp), args.seed)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump([asdict(r) for r in results], file, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -33,3 +33,8 @@ def part1(data):
     summed_value = sum(values)
 
     return summed_value
+
+
+# entry points for run.py
+parse = parse_input
+solve = part1
@@ -25,3 +25,8 @@ def part2(data):
 
     # multiply each number by the number of times it appears in column2 and sum all these numbers
     return sum([number * count[number] for number in count])
+
+
+# entry points for run.py
+parse = parse_input
+solve = part2
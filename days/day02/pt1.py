@@ -62,5 +62,14 @@ def day02_part1(file_path="day02_input.txt"):
     print(f"Number of safe arrays: {safe_arrays_count}")
 
 
+# entry points for run.py
+parse = load_to_numpy_arrays_from_file
+
+
+def solve(numpy_arrays):
+    """Count the safe reports among the already loaded arrays."""
+    return sum(1 for array in numpy_arrays if is_array_safe(array))
+
+
 if __name__ == "__main__":
     day02_part1()
@@ -66,5 +66,14 @@ def day02_part2(file_path="day02_input.txt"):
     print(f"Number of safe arrays with Dampener: {safe_arrays_count}")
 
 
+# entry points for run.py
+parse = load_to_numpy_arrays_from_file
+
+
+def solve(numpy_arrays):
+    """Count the reports that are safe with the Problem Dampener."""
+    return sum(1 for array in numpy_arrays if is_array_safe(array) or can_be_safe_with_removal(array))
+
+
 if __name__ == "__main__":
     day02_part2()
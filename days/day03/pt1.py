@@ -22,6 +22,7 @@ def get_multiplications(data: list):
             )
 
     print(t)
+    return t
 
 
 def day03_part1():
@@ -36,5 +37,10 @@ def day03_part1():
     #get_multiplications(data_in)
 
 
+# entry points for run.py
+parse = read_file
+solve = get_multiplications
+
+
 if __name__ == '__main__':
     day03_part1()
@@ -36,6 +36,7 @@ def get_multiplications(data: list):
                 print("Skipping multiplication")
         print(f"Summation: {summation}")
     print(f"Final Summation: {summation}")
+    return summation
 
 
 def day03_part2():
@@ -49,6 +50,11 @@ def day03_part2():
     get_multiplications(data_in)
 
 
+# entry points for run.py
+parse = read_file
+solve = get_multiplications
+
+
 if __name__ == '__main__':
     day03_part2() #97728793 187833789
     print(97728793 < 187833789)
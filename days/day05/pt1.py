@@ -81,6 +81,15 @@ def sum_middle_of_correct_updates(rule_lines, update_lines):
     return total
 
 
+# entry points for run.py
+parse = read_file
+
+
+def solve(data):
+    rule_lines, update_lines = data
+    return int(sum_middle_of_correct_updates(rule_lines, update_lines))
+
+
 if __name__ == "__main__":
     # Replace 'input.txt' with the actual filename
     rule_lines, update_lines = read_file('in.txt')
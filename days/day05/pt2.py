@@ -143,6 +143,15 @@ def sum_middle_of_reordered_incorrect_updates(rule_lines, update_lines):
     return total
 
 
+# entry points for run.py
+parse = read_file
+
+
+def solve(data):
+    rule_lines, update_lines = data
+    return int(sum_middle_of_reordered_incorrect_updates(rule_lines, update_lines))
+
+
 if __name__ == "__main__":
     # Example usage (using the example from Part Two):
     rule_lines, update_lines = read_file('in.txt')
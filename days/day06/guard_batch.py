@@ -0,0 +1,113 @@
+"""
+Batched NumPy simulation of many day 6 guards at once.
+
+Every candidate obstacle gets its own guard; all guards advance turn by turn
+in lockstep as arrays of cells and direction codes. Guards that walk off the
+map or come back to an earlier (stop cell, direction) turn are masked out of
+the active set, so each step is a handful of fancy-indexed array operations
+over the guards that are still walking.
+
+Loops are found with Brent's cycle detection: each guard keeps one saved turn,
+replaced whenever its turn count reaches a power of two, and is looping once
+it meets that turn again. This costs a few integers per guard instead of a
+visited set per guard, so memory does not grow with the size of the map. The
+jump table itself is built with array operations too.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from guard_grid import GuardMap
+
+
+def jump_arrays(guard_map: GuardMap) -> np.ndarray:
+    """
+    GuardMap.jump_table() as a (4, cells) int64 array, computed with running
+    minima and maxima over the rows and columns instead of a Python loop per cell.
+    """
+    width, height = guard_map.width, guard_map.height
+    blocked = np.frombuffer(bytes(guard_map.blocked), dtype=np.uint8).astype(bool).reshape(height, width)
+    rows = np.broadcast_to(np.arange(height)[:, None], (height, width))
+    cols = np.broadcast_to(np.arange(width), (height, width))
+
+    # nearest obstacle strictly before / after each cell, along its row and its column
+    left = np.maximum.accumulate(np.where(blocked, cols, -1), axis=1)
+    right = np.minimum.accumulate(np.where(blocked, cols, width)[:, ::-1], axis=1)[:, ::-1]
+    up = np.maximum.accumulate(np.where(blocked, rows, -1), axis=0)
+    down = np.minimum.accumulate(np.where(blocked, rows, height)[::-1], axis=0)[::-1]
+    left = np.pad(left[:, :-1], ((0, 0), (1, 0)), constant_values=-1)
+    right = np.pad(right[:, 1:], ((0, 0), (0, 1)), constant_values=width)
+    up = np.pad(up[:-1], ((1, 0), (0, 0)), constant_values=-1)
+    down = np.pad(down[1:], ((0, 1), (0, 0)), constant_values=height)
+
+    jumps = np.stack([
+        np.where(up >= 0, (up + 1) * width + cols, -1),
+        np.where(right < width, rows * width + right - 1, -1),
+        np.where(down < height, (down - 1) * width + cols, -1),
+        np.where(left >= 0, rows * width + left + 1, -1),
+    ]).reshape(4, -1)
+    jumps[:, blocked.ravel()] = -1
+    return jumps
+
+
+def simulate_candidates(guard_map: GuardMap, states: List[Tuple[int, int, int]], batch_size: int = 1 << 16) -> np.ndarray:
+    """
+    Checks every candidate obstacle of GuardMap.route_states() for a loop.
+
+    Parameters:
+        guard_map (GuardMap): The original map.
+        states (List[Tuple[int, int, int]]): (new obstacle, resume cell, resume direction) per candidate.
+        batch_size (int): Guards simulated together; a few int64 arrays of this length.
+
+    Returns:
+        np.ndarray: Boolean array, True where the candidate traps the guard in a loop.
+    """
+    width = guard_map.width
+    jumps = jump_arrays(guard_map)
+    step = np.array([-width, 1, width, -1], dtype=np.int64)
+
+    candidates = np.array(states, dtype=np.int64).reshape(-1, 3)
+    loops = np.zeros(len(candidates), dtype=bool)
+
+    for batch_start in range(0, len(candidates), batch_size):
+        batch = candidates[batch_start:batch_start + batch_size]
+        guard = np.arange(len(batch))
+        new_obstacle, here, direction = batch[:, 0], batch[:, 1], batch[:, 2]
+        obstacle_row, obstacle_col = np.divmod(new_obstacle, width)
+        # Brent: the turn saved at the last power of two, the current power and the turns since then
+        saved = np.full(len(batch), -1, dtype=np.int64)
+        power = np.ones(len(batch), dtype=np.int64)
+        length = np.zeros(len(batch), dtype=np.int64)
+
+        while len(guard):
+            stop = jumps[direction, here]
+            row, col = np.divmod(here, width)
+            stop_row, stop_col = np.divmod(stop, width)
+            exits = stop < 0
+
+            # cut the jump short where the guard's own obstacle lies between here and the stop (or the edge)
+            same_col = col == obstacle_col
+            same_row = row == obstacle_row
+            cut = ((direction == 0) & same_col & (obstacle_row < row) & (exits | (obstacle_row >= stop_row))) \
+                | ((direction == 2) & same_col & (obstacle_row > row) & (exits | (obstacle_row <= stop_row))) \
+                | ((direction == 3) & same_row & (obstacle_col < col) & (exits | (obstacle_col >= stop_col))) \
+                | ((direction == 1) & same_row & (obstacle_col > col) & (exits | (obstacle_col <= stop_col)))
+            stop = np.where(cut, new_obstacle - step[direction], stop)
+
+            walking = stop >= 0
+            state = stop * 4 + direction
+            looped = walking & (state == saved)
+            loops[batch_start + guard[looped]] = True
+
+            length += 1
+            restart = length == power
+            saved = np.where(restart, state, saved)
+            power = np.where(restart, power * 2, power)
+            length = np.where(restart, 0, length)
+
+            keep = walking & ~looped
+            guard, here, direction = guard[keep], stop[keep], (direction[keep] + 1) & 3
+            new_obstacle, obstacle_row, obstacle_col = new_obstacle[keep], obstacle_row[keep], obstacle_col[keep]
+            saved, power, length = saved[keep], power[keep], length[keep]
+
+    return loops
@@ -0,0 +1,264 @@
+"""
+Occupancy grid engine for the day 6 guard simulation.
+
+The map is stored row-major in a bytearray (1 = obstacle) and the guard's
+direction is an integer code, so every step is an index lookup instead of a
+scan over a list of obstacle coordinates.
+"""
+from typing import List, Optional, Tuple
+
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTION_CODES = {'^': UP, '>': RIGHT, 'v': DOWN, '<': LEFT}
+ROW_STEP = (-1, 0, 1, 0)
+COL_STEP = (0, 1, 0, -1)
+
+
+class GuardMap:
+    """
+    The lab map as an occupancy grid plus the guard's starting state.
+
+    Cells are addressed by their flat index row * width + col, turning right
+    is (direction + 1) % 4.
+    """
+
+    def __init__(self, width: int, height: int, blocked: bytearray, guard_row: int, guard_col: int,
+                 guard_direction: int):
+        self.width = width
+        self.height = height
+        self.blocked = blocked
+        self.guard_row = guard_row
+        self.guard_col = guard_col
+        self.guard_direction = guard_direction
+        self._jumps: Optional[Tuple[List[int], List[int], List[int], List[int]]] = None
+
+    @property
+    def guard_cell(self) -> int:
+        return self.guard_row * self.width + self.guard_col
+
+    def route(self) -> List[int]:
+        """
+        Walks the guard until it leaves the map.
+
+        Returns:
+            List[int]: Flat indices of the distinct cells visited, in order of first visit.
+
+        Raises:
+            ValueError: If the guard is trapped in a loop and never leaves the map.
+        """
+        return [self.guard_cell] + [cell for cell, _, _ in self.route_states()]
+
+    def route_states(self) -> List[Tuple[int, int, int]]:
+        """
+        Walks the guard until it leaves the map, recording how each new cell is first entered.
+
+        Returns:
+            List[Tuple[int, int, int]]: (cell, previous cell, direction) for every distinct
+            cell after the starting one, in order of first visit.
+
+        Raises:
+            ValueError: If the guard is trapped in a loop and never leaves the map.
+        """
+        width, height, blocked = self.width, self.height, self.blocked
+        row, col, direction = self.guard_row, self.guard_col, self.guard_direction
+
+        # one bit per direction the guard has faced in each cell, as in LoopTracker
+        seen = bytearray(width * height)
+        states = []
+
+        while True:
+            here = row * width + col
+            if seen[here] >> direction & 1:
+                raise ValueError("guard never leaves the map")
+            seen[here] |= 1 << direction
+
+            next_row, next_col = row + ROW_STEP[direction], col + COL_STEP[direction]
+            if not (0 <= next_row < height and 0 <= next_col < width):
+                return states
+            cell = next_row * width + next_col
+            if blocked[cell]:
+                direction = (direction + 1) & 3
+                continue
+            if not seen[cell]:
+                states.append((cell, here, direction))
+            row, col = next_row, next_col
+
+    def jump_table(self) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """
+        Next-obstacle index per direction, built on first use.
+
+        jump_table()[direction][cell] is the cell where a guard leaving `cell`
+        in `direction` stops in front of the next obstacle, or -1 if it walks
+        off the map instead.
+        """
+        if self._jumps is None:
+            width, height, blocked = self.width, self.height, self.blocked
+            up, right, down, left = ([-1] * (width * height) for _ in range(4))
+            for r in range(height):
+                stop = -1
+                for c in range(width):
+                    cell = r * width + c
+                    if blocked[cell]:
+                        stop = cell + 1
+                    else:
+                        left[cell] = stop
+                stop = -1
+                for c in range(width - 1, -1, -1):
+                    cell = r * width + c
+                    if blocked[cell]:
+                        stop = cell - 1
+                    else:
+                        right[cell] = stop
+            for c in range(width):
+                stop = -1
+                for r in range(height):
+                    cell = r * width + c
+                    if blocked[cell]:
+                        stop = cell + width
+                    else:
+                        up[cell] = stop
+                stop = -1
+                for r in range(height - 1, -1, -1):
+                    cell = r * width + c
+                    if blocked[cell]:
+                        stop = cell - width
+                    else:
+                        down[cell] = stop
+            self._jumps = (up, right, down, left)
+        return self._jumps
+
+
+def record_obstacles(lines: List[str]) -> GuardMap:
+    """
+    Parses the map lines into a GuardMap.
+
+    Parameters:
+        lines (List[str]): The map rows, '#' for obstacles and one of '^>v<' for the guard.
+
+    Returns:
+        GuardMap: The occupancy grid with the guard's position and direction.
+    """
+    lines = [line for line in lines if line]
+    height, width = len(lines), len(lines[0])
+    blocked = bytearray(width * height)
+    guard_row = guard_col = 0
+    guard_direction = UP
+
+    for r, line in enumerate(lines):
+        for c, char in enumerate(line):
+            if char == '#':
+                blocked[r * width + c] = 1
+            elif char in DIRECTION_CODES:
+                guard_row, guard_col = r, c
+                guard_direction = DIRECTION_CODES[char]
+
+    return GuardMap(width, height, blocked, guard_row, guard_col, guard_direction)
+
+
+class LoopTracker:
+    """
+    Visited (cell, direction) states of one simulation as a bitset.
+
+    Each cell owns one byte with a bit per direction. Only the cells touched
+    by a simulation are cleared by reset(), so reusing the tracker across
+    candidates costs nothing proportional to the map size.
+    """
+
+    def __init__(self, cell_count: int):
+        self.seen = bytearray(cell_count)
+        self.touched: List[int] = []
+
+    def reset(self) -> None:
+        seen = self.seen
+        for cell in self.touched:
+            seen[cell] = 0
+        self.touched.clear()
+
+
+def check_attempt(guard_map: GuardMap, new_obstacle: int, tracker: Optional[LoopTracker] = None,
+                  start: Optional[Tuple[int, int]] = None) -> int:
+    """
+    Checks whether an extra obstacle at `new_obstacle` traps the guard in a loop.
+
+    The guard teleports from turn to turn using the map's jump table; the extra
+    obstacle is overlaid by cutting a jump short when it lies on the segment
+    being travelled, so a simulation costs one iteration per turn. The guard
+    loops exactly when it turns at the same cell in the same direction twice.
+    The grid itself is not modified, so the same GuardMap can be shared by
+    concurrent attempts.
+
+    When the obstacle lies on the original route, the walk up to its first
+    visit is unaffected by it, so `start` may resume the guard from the state
+    just before that visit (see GuardMap.route_states). Any loop is still
+    detected, since its states repeat after the resume point.
+
+    Parameters:
+        guard_map (GuardMap): The original map.
+        new_obstacle (int): Flat index of the cell to block.
+        tracker (LoopTracker): Reusable state bitset; a fresh one is allocated when omitted.
+        start (Tuple[int, int]): (cell, direction) to start from instead of the guard's start.
+
+    Returns:
+        int: 1 if the guard loops, 0 if it walks off the map.
+    """
+    width = guard_map.width
+    jumps = guard_map.jump_table()
+    obstacle_row, obstacle_col = divmod(new_obstacle, width)
+    here, direction = start if start is not None else (guard_map.guard_cell, guard_map.guard_direction)
+
+    if tracker is None:
+        tracker = LoopTracker(width * guard_map.height)
+    else:
+        tracker.reset()
+    seen, touched = tracker.seen, tracker.touched
+
+    while True:
+        stop = jumps[direction][here]
+        row, col = divmod(here, width)
+
+        # cut the jump short if the new obstacle sits between here and the stop (or the edge)
+        if direction == UP:
+            if col == obstacle_col and obstacle_row < row and (stop < 0 or obstacle_row >= stop // width):
+                stop = new_obstacle + width
+        elif direction == DOWN:
+            if col == obstacle_col and obstacle_row > row and (stop < 0 or obstacle_row <= stop // width):
+                stop = new_obstacle - width
+        elif direction == LEFT:
+            if row == obstacle_row and obstacle_col < col and (stop < 0 or obstacle_col >= stop % width):
+                stop = new_obstacle + 1
+        elif row == obstacle_row and obstacle_col > col and (stop < 0 or obstacle_col <= stop % width):
+            stop = new_obstacle - 1
+
+        if stop < 0:
+            return 0
+
+        bit = 1 << direction
+        if seen[stop] & bit:
+            return 1
+        if not seen[stop]:
+            touched.append(stop)
+        seen[stop] |= bit
+
+        here = stop
+        direction = (direction + 1) & 3
+
+
+# state of a process-pool worker, set once by init_worker
+_worker_map: Optional[GuardMap] = None
+_worker_tracker: Optional[LoopTracker] = None
+
+
+def init_worker(guard_map: GuardMap) -> None:
+    """Process-pool initializer: keeps the shipped map and builds its jump table once per worker."""
+    global _worker_map, _worker_tracker
+    _worker_map = guard_map
+    _worker_map.jump_table()
+    _worker_tracker = LoopTracker(guard_map.width * guard_map.height)
+
+
+def count_loops(states: List[Tuple[int, int, int]]) -> int:
+    """
+    Counts the looping candidates in a chunk of GuardMap.route_states() entries,
+    using the map installed by init_worker.
+    """
+    return sum(check_attempt(_worker_map, cell, _worker_tracker, (previous_cell, direction))
+               for cell, previous_cell, direction in states)
@@ -0,0 +1,44 @@
+from guard_batch import simulate_candidates
+from guard_grid import record_obstacles
+
+
+def load_file(file_path: str):
+    with open(file_path) as f:
+        return [line.rstrip('\n') for line in f]
+
+
+def solve(lines: list, batch_size: int = 1 << 16):
+    guard_map = record_obstacles(lines)
+
+    print(f"Map Size: {guard_map.width}x{guard_map.height}")
+    print(f"Guard Position: {guard_map.guard_row}, {guard_map.guard_col}")
+    print(f"Guard Direction: {guard_map.guard_direction}")
+
+    print("---------------------------------------------------")
+
+    positions_to_try = guard_map.route_states()
+    print(len(positions_to_try) + 1)
+    print(f"Positions to try: {len(positions_to_try)}")
+
+    # all candidate guards advance together, one array step per turn
+    loops = simulate_candidates(guard_map, positions_to_try, batch_size)
+
+    total_working_obstacles = int(loops.sum())
+    print(total_working_obstacles)
+    return total_working_obstacles
+
+
+def day06_pt2(file_path: str):
+    return solve(load_file(file_path))
+
+
+# entry points for run.py
+parse = load_file
+
+
+if __name__ == "__main__":
+    file_path = "in.txt"
+    import time
+    start = time.time()
+    day06_pt2(file_path)  # 1984
+    print(f"Time: {time.time() - start}")
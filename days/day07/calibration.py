@@ -0,0 +1,216 @@
+"""
+Bottom-up solver for the day 7 calibration equations.
+
+Instead of trying every operator combination forward from the first number,
+the solver starts at the target and undoes the operators from the last number
+backwards: subtraction for '+', exact division for '*' and stripping a digit
+suffix for '||'. The optional '/' is exact integer division, so its inverse is
+a plain multiplication. A branch is dropped as soon as its inverse does not
+apply, which prunes almost the whole 2^n / 3^n tree.
+
+Operators live in a registry keyed by their symbol; the search only sees
+their inverses, so new operators can be enabled without touching it.
+
+Equations are plain (target, tuple of ints) pairs: Python ints never overflow,
+unlike the NumPy int64 scalars the solvers used to multiply.
+"""
+import os
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# returned by an inverse when the equation holds whatever the prefix evaluates to (e.g. value 0 = prefix * 0)
+ANY_PREFIX = object()
+
+POWERS_OF_TEN = [10 ** k for k in range(1, 40)]
+
+
+def next_power_of_ten(number: int) -> int:
+    """The smallest power of ten above a non-negative number, i.e. the shift used to append its digits."""
+    index = bisect_right(POWERS_OF_TEN, number)
+    return POWERS_OF_TEN[index] if index < len(POWERS_OF_TEN) else 10 ** len(str(number))
+
+
+def concatenate(a: int, b: int) -> int:
+    """
+    Concatenates two non-negative integers by their digits, without going through strings.
+
+    Example:
+        concatenate(12, 345) -> 12345
+    """
+    return a * next_power_of_ten(b) + b
+
+
+class Operator(NamedTuple):
+    symbol: str
+    # undo(value, number) -> the prefix value that `prefix <op> number == value` requires, or None
+    undo: Callable[[int, int], object]
+    # whether the operator keeps non-negative operands non-negative, which lets the search prune negative prefixes
+    non_negative: bool = True
+
+
+def _undo_add(value: int, number: int) -> Optional[int]:
+    return value - number
+
+
+def _undo_multiply(value: int, number: int) -> object:
+    if number == 0:
+        return ANY_PREFIX if value == 0 else None
+    return value // number if value % number == 0 else None
+
+
+def _undo_concatenate(value: int, number: int) -> Optional[int]:
+    # digits are only appended to non-negative prefixes
+    if value < 0:
+        return None
+    power = next_power_of_ten(number)
+    return value // power if value % power == number else None
+
+
+def _undo_subtract(value: int, number: int) -> Optional[int]:
+    return value + number
+
+
+def _undo_exact_divide(value: int, number: int) -> Optional[int]:
+    # '/' only applies when number divides the prefix exactly, so prefix / number == value
+    # has the single solution value * number; 8 / 3 * 9 == 24 does not count
+    return value * number if number != 0 else None
+
+
+OPERATORS: Dict[str, Operator] = {}
+
+
+def register_operator(operator: Operator) -> None:
+    OPERATORS[operator.symbol] = operator
+
+
+register_operator(Operator('+', _undo_add))
+register_operator(Operator('*', _undo_multiply))
+register_operator(Operator('||', _undo_concatenate))
+register_operator(Operator('-', _undo_subtract, non_negative=False))
+register_operator(Operator('/', _undo_exact_divide))
+
+# tried in this order; the most selective inverses go first
+PART1_OPERATORS = ('*', '+')
+PART2_OPERATORS = ('*', '||', '+')
+
+
+def can_make_target(target: int, numbers: Sequence[int], operators: Tuple[str, ...] = PART1_OPERATORS) -> bool:
+    """
+    Determines if the target can be formed from the numbers in order, evaluated left to right.
+
+    Parameters:
+        target (int): The target number to form.
+        numbers (Sequence[int]): The operands, all non-negative.
+        operators (Tuple[str, ...]): Symbols of the registered operators allowed between operands.
+            '/' is exact integer division: it only applies where the prefix is a multiple of the operand.
+
+    Returns:
+        bool: True if some choice of operators yields the target.
+
+    Raises:
+        ValueError: If '||' is combined with an operator that can make a prefix negative.
+    """
+    non_negative = all(OPERATORS[symbol].non_negative for symbol in operators)
+    if '||' in operators and not non_negative:
+        # appending digits to a negative prefix has no inverse the search could undo
+        raise ValueError("'||' cannot be combined with operators that produce negative values")
+    if len(numbers) == 0:
+        return False
+    numbers = [int(n) for n in numbers]
+    undos = tuple(OPERATORS[symbol].undo for symbol in operators)
+    return _reaches(target, numbers, len(numbers) - 1, undos, non_negative)
+
+
+def _reaches(value: int, numbers: list, index: int, undos: tuple, non_negative: bool) -> bool:
+    """Whether numbers[:index + 1] can evaluate to value."""
+    number = numbers[index]
+    if index == 0:
+        return value == number
+
+    for undo in undos:
+        prefix = undo(value, number)
+        if prefix is None or (non_negative and prefix is not ANY_PREFIX and prefix < 0):
+            continue
+        if prefix is ANY_PREFIX or _reaches(prefix, numbers, index - 1, undos, non_negative):
+            return True
+    return False
+
+
+Equation = Tuple[int, Tuple[int, ...]]
+
+
+def iter_equations(file_path: str) -> Iterator[Equation]:
+    """
+    Lazily parses a calibration file, one "target: n1 n2 ..." line at a time.
+
+    Malformed lines are reported and skipped. Nothing beyond the current line
+    is held in memory, so arbitrarily large logs can be streamed.
+    """
+    with open(file_path, 'r') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            left, separator, right = line.partition(':')
+            try:
+                if not separator:
+                    raise ValueError
+                equation = int(left), tuple(map(int, right.split()))
+            except ValueError:
+                print(f"Skipping malformed line {line_number}: {line}")
+                continue
+            yield equation
+
+
+def _chunked(equations: Iterable[Equation], chunk_size: int) -> Iterator[List[Equation]]:
+    iterator = iter(equations)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _solve_chunk(chunk: Tuple[Tuple[str, ...], List[Equation]]) -> List[bool]:
+    operators, equations = chunk
+    return [can_make_target(target, numbers, operators) for target, numbers in equations]
+
+
+def solve_stream(equations: Iterable[Equation], operators: Tuple[str, ...] = PART1_OPERATORS,
+                 max_workers: Optional[int] = None, chunk_size: int = 256) -> Iterator[Tuple[Equation, bool]]:
+    """
+    Checks equations as they arrive, spreading chunks of them over worker processes.
+
+    At most two chunks per worker are in flight at a time, so memory stays
+    constant however long the input is.
+
+    Parameters:
+        equations (Iterable[Equation]): (target, operands) pairs of plain ints, e.g. from iter_equations.
+        operators (Tuple[str, ...]): Symbols of the registered operators to allow.
+        max_workers (int): Worker processes; defaults to the CPU count, 1 solves in this process.
+        chunk_size (int): Equations sent to a worker per task.
+
+    Yields:
+        Tuple[Equation, bool]: Each equation with whether it can be made true, in input order.
+    """
+    chunks = _chunked(equations, chunk_size)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    head = list(islice(chunks, 2))
+    if max_workers == 1 or len(head) < 2:
+        # a single chunk is not worth starting a pool for
+        for chunk in chain(head, chunks):
+            yield from zip(chunk, _solve_chunk((operators, chunk)))
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for chunk in chain(head, chunks):
+            pending.append((chunk, executor.submit(_solve_chunk, (operators, chunk))))
+            if len(pending) >= 2 * max_workers:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
+
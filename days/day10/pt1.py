@@ -133,5 +133,11 @@ def main():
     print("---------------------------------------------------")
     print(f"Sum of all trailhead scores: {total_trails}")
 
+
+# entry points for run.py
+parse = load_grid
+solve = find_all_trails
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,217 @@
+"""
+Fast-forwarding day 11 to astronomically large blink counts.
+
+Once the set of stone values reachable from the input is closed under the
+blink rule, a blink is a linear map on the value counts: a sparse transition
+matrix with one or two entries per value. The total stone count after t
+blinks is then 1^T M^t v, which satisfies a linear recurrence whose order is
+at most the number of values.
+
+Squaring the dense ~4000x4000 matrix itself is far too slow in Python, so the
+recurrence is recovered instead (Berlekamp-Massey over the first 2n counts,
+produced by sparse matrix-vector blinks) and x^t is computed modulo its
+characteristic polynomial by exponentiation by squaring. That is the same as
+raising the recurrence's companion matrix to the t-th power, at O(n^2) per
+squaring, so 10^12 blinks cost about 40 squarings.
+
+All of this works modulo a prime below 2^31, small enough for the int64
+products below to stay exact. Exact counts grow ~1.5x per blink and are left
+to stones.count_stones.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from stones import blink_stone, count_stones
+
+DEFAULT_MODULUS = 2_147_483_647  # 2^31 - 1, prime
+_LIMB = 1 << 16
+_DOT_BLOCK = 4096  # keeps int64 dot products of 31 x 16 bit values below 2^63
+
+
+def closed_values(stones: Iterable[int], max_values: int = 1_000_000) -> List[int]:
+    """
+    Every stone value reachable from the given stones by blinking.
+
+    Raises:
+        ValueError: If more than max_values distinct values show up.
+    """
+    values = list(dict.fromkeys(int(stone) for stone in stones))
+    index = set(values)
+    position = 0
+    while position < len(values):
+        for new_stone in blink_stone(values[position]):
+            if new_stone not in index:
+                index.add(new_stone)
+                values.append(new_stone)
+        position += 1
+        if len(values) > max_values:
+            raise ValueError(f"stone values did not close within {max_values} distinct values")
+    return values
+
+
+def transition_matrix(values: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The blink rule over a closed value set as a sparse matrix in coordinate form.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (source, target) value indices, one pair per stone a value turns into.
+    """
+    index = {value: i for i, value in enumerate(values)}
+    source, target = [], []
+    for i, value in enumerate(values):
+        for new_stone in blink_stone(value):
+            source.append(i)
+            target.append(index[new_stone])
+    return np.array(source, dtype=np.int64), np.array(target, dtype=np.int64)
+
+
+def is_prime(n: int) -> bool:
+    """Deterministic Miller-Rabin with bases 2, 3, 5 and 7, exact for n < 3,215,031,751 (so every n below 2^31)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in (2, 3, 5, 7):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _dot_mod(a: np.ndarray, b: np.ndarray, modulus: int) -> int:
+    """Exact (a . b) mod modulus for int64 arrays of residues below 2^31."""
+    total = 0
+    for start in range(0, len(a), _DOT_BLOCK):
+        block_a, block_b = a[start:start + _DOT_BLOCK], b[start:start + _DOT_BLOCK]
+        high = int(block_a @ (block_b >> 16)) % modulus
+        low = int(block_a @ (block_b & (_LIMB - 1))) % modulus
+        total += high * _LIMB + low
+    return total % modulus
+
+
+def _convolve_mod(a: np.ndarray, b: np.ndarray, modulus: int) -> np.ndarray:
+    """Exact polynomial product mod modulus, splitting coefficients into 16-bit limbs."""
+    a_high, a_low = a >> 16, a & (_LIMB - 1)
+    b_high, b_low = b >> 16, b & (_LIMB - 1)
+    low = np.convolve(a_low, b_low) % modulus
+    middle = (np.convolve(a_high, b_low) + np.convolve(a_low, b_high)) % modulus
+    high = np.convolve(a_high, b_high) % modulus
+    return (low + middle * _LIMB % modulus + high * (_LIMB * _LIMB % modulus) % modulus) % modulus
+
+
+def stone_count_sequence(values: List[int], stones: Iterable[int], length: int, modulus: int) -> np.ndarray:
+    """Total stone count mod modulus after 0, 1, ..., length - 1 blinks, via sparse matrix-vector products."""
+    source, target = transition_matrix(values)
+    index = {value: i for i, value in enumerate(values)}
+    counts = np.zeros(len(values), dtype=np.int64)
+    for stone in stones:
+        counts[index[int(stone)]] += 1
+
+    sequence = np.empty(length, dtype=np.int64)
+    for t in range(length):
+        sequence[t] = int(counts.sum()) % modulus
+        # float64 sums of fewer than 2^22 residues below 2^31 are exact
+        counts = np.bincount(target, weights=counts[source], minlength=len(values)).astype(np.int64) % modulus
+    return sequence
+
+
+def berlekamp_massey(sequence: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Shortest linear recurrence of a sequence over the prime field.
+
+    Returns:
+        np.ndarray: c_1..c_L with s[k] = sum(c_i * s[k - i]) mod modulus for all k >= L.
+    """
+    n = len(sequence)
+    current = np.zeros(n + 1, dtype=np.int64)
+    previous = np.zeros(n + 1, dtype=np.int64)
+    current[0] = previous[0] = 1
+    length, shift, previous_discrepancy = 0, 1, 1
+
+    for k in range(n):
+        # discrepancy = s[k] + sum(C[i] * s[k - i])
+        discrepancy = (int(sequence[k]) + _dot_mod(current[1:length + 1], sequence[k - length:k][::-1], modulus)) % modulus
+        if discrepancy == 0:
+            shift += 1
+            continue
+        factor = discrepancy * pow(previous_discrepancy, modulus - 2, modulus) % modulus
+        updated = current.copy()
+        updated[shift:] = (updated[shift:] - factor * previous[:n + 1 - shift] % modulus) % modulus
+        if 2 * length <= k:
+            length, previous, previous_discrepancy, shift = k + 1 - length, current, discrepancy, 1
+        else:
+            shift += 1
+        current = updated
+
+    return (-current[1:length + 1]) % modulus
+
+
+def _reduce(poly: np.ndarray, recurrence: np.ndarray, modulus: int) -> np.ndarray:
+    """poly mod (x^L - c_1 x^(L-1) - ... - c_L), with poly stored lowest degree first."""
+    order = len(recurrence)
+    poly = poly.copy()
+    reversed_recurrence = recurrence[::-1]  # coefficient of x^(k-L+j) that replaces x^k is c_(L-j)
+    for k in range(len(poly) - 1, order - 1, -1):
+        if poly[k]:
+            poly[k - order:k] = (poly[k - order:k] + int(poly[k]) * reversed_recurrence) % modulus
+    return poly[:order]
+
+
+def nth_term(sequence: np.ndarray, recurrence: np.ndarray, n: int, modulus: int) -> int:
+    """
+    s[n] of a linear recurrence, from x^n mod its characteristic polynomial computed by
+    exponentiation by squaring.
+    """
+    order = len(recurrence)
+    if n < len(sequence):
+        return int(sequence[n])
+    if order == 0:
+        return 0
+
+    result = np.zeros(order, dtype=np.int64)
+    result[0] = 1  # the polynomial 1 = x^0
+    for bit in bin(n)[2:]:
+        result = _reduce(_convolve_mod(result, result, modulus), recurrence, modulus)
+        if bit == '1':
+            result = _reduce(np.concatenate(([0], result)), recurrence, modulus)
+    return _dot_mod(result, sequence[:order], modulus)
+
+
+def fast_forward_count(stones: Iterable[int], blinks: int, modulus: Optional[int] = DEFAULT_MODULUS) -> int:
+    """
+    Number of stones after `blinks` blinks, modulo `modulus`.
+
+    Parameters:
+        stones (Iterable[int]): The initial stone values.
+        blinks (int): How many times to blink, e.g. 10**12.
+        modulus (int): A prime below 2^31; None computes the exact count by simulating every blink.
+
+    Returns:
+        int: The stone count (mod modulus).
+
+    Raises:
+        ValueError: If modulus is not a prime below 2^31; Berlekamp-Massey needs inverses modulo it.
+    """
+    stones = [int(stone) for stone in stones]
+    if modulus is None:
+        return count_stones(stones, blinks)
+    if not (1 < modulus < 1 << 31 and is_prime(modulus)):
+        raise ValueError("modulus must be a prime below 2^31")
+
+    values = closed_values(stones)
+    # the recurrence has order at most len(values), so 2 * len(values) terms determine it
+    sequence = stone_count_sequence(values, stones, min(blinks + 1, 2 * len(values) + 2), modulus)
+    if blinks < len(sequence):
+        return int(sequence[blinks])
+    return nth_term(sequence, berlekamp_massey(sequence, modulus), blinks, modulus)
@@ -1,5 +1,7 @@
 import numpy as np
 
+from stones import blink_array, count_stones
+
 
 def import_data(input_file='test.txt'):
     with open(input_file, 'r') as file:
@@ -10,39 +12,25 @@ def import_data(input_file='test.txt'):
 
 
 def update_stones(stones):
+    # one vectorized blink over the whole array (see stones.blink_array)
+    return blink_array(stones)
 
-    updates_to_apply = []
-
-    for i, stone in enumerate(stones):
-        if stone == 0:
-            updates_to_apply.append(1)
-        elif len(str(stone)) % 2 == 0:
-            # split the number in half as string
-            half = len(str(stone)) // 2
-            left = str(stone)[:half]
-            right = str(stone)[half:]
-
-            updates_to_apply.append(int(left))
-            updates_to_apply.append(int(right))
-        else:
-            stone *= 2024
-            updates_to_apply.append(stone)
-
-    # redefine stones array based on updates, where for each item in updates is a tuple with index
-    # where the new item should be placed and the new value
-    stones = np.array(updates_to_apply)
-    return stones
 
 def day11_part1():
     stones = import_data('in.txt')
     print(stones)
 
+    # materializing every stone is exponential in the blinks, so count them by value instead
     blinks = 75
-    for _ in range(blinks):
-        stones = update_stones(stones)
-        print(stones)
+    print(count_stones(stones, blinks))
+
+
+# entry points for run.py
+parse = import_data
+
 
-    print(len(stones))
+def solve(stones, blinks=25):
+    return count_stones(stones, blinks)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,8 @@
-from functools import cache
 from time import perf_counter
 
-import numpy as np
+from fast_forward import DEFAULT_MODULUS, fast_forward_count
+from stones import count_stones
+
 
 def import_data(input_file='test.txt'):
     with open(input_file, 'r') as file:
@@ -10,52 +11,31 @@ def import_data(input_file='test.txt'):
     return data  # Return as a regular list for easier iteration
 
 
-@cache
-def count(stone, depth):
-    # Every call adds 1 to the count
-    counter = 0
-
-    if depth <= 0:
-        return 0
-
-    if stone == 0:
-        # Recursive call for splitting stone
-        counter += count(1, depth - 1)
-        return counter
-
-    elif len(str(stone)) % 2 == 0:
-        # Split the number in half as a string
-        half = len(str(stone)) // 2
-        left = int(str(stone)[:half])
-        right = int(str(stone)[half:])
-        counter += count(left, depth - 1) + count(right, depth - 1)
-        counter += 1
-        return counter
-
-    # Recursive call for odd-length stones
-    counter += count(stone * 2024, depth - 1)
+def day11_part2():
+    stones = import_data('in.txt')
 
-    return counter
+    # Evolve a {value: multiplicity} histogram over 75 blinks
+    blinks = 75
+    total_count = count_stones(stones, blinks)
 
+    print(total_count)
 
 
-def day11_part2():
+def day11_part2_fast_forward(blinks=10 ** 12, modulus=DEFAULT_MODULUS):
     stones = import_data('in.txt')
 
-    # Process stones recursively over 75 blinks
-    blinks = 75
-    total_count = 0
+    # Blink counts far beyond what can be simulated, modulo a prime (see fast_forward.py)
+    total_count = fast_forward_count(stones, blinks, modulus)
 
-    #for stone in stones:
-    #    total_count += count(stone, blinks)
+    print(total_count)
 
-    total_count += sum([count(stone, blinks) for stone in stones])
-    total_count += len(stones)
 
-    #total_count += len(stones)
-    #total_count += count(1, 2)
+# entry points for run.py
+parse = import_data
 
-    print(total_count)
+
+def solve(stones, blinks=75):
+    return count_stones(stones, blinks)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,118 @@
+"""
+Count-based stone evolution for day 11.
+
+Stones never interact and equal stones evolve identically, so instead of a
+list of stones the engine keeps a {value: multiplicity} histogram and applies
+the blink rule once per distinct value. Memory is proportional to the number
+of distinct values (a few thousand for the puzzle) rather than to the number
+of stones, so thousands of blinks stay cheap.
+
+For callers that need the actual stones, blink_array applies one blink to a
+whole int64 array at once.
+"""
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+POWERS_OF_TEN = [10 ** k for k in range(1, 40)]
+INT64_POWERS_OF_TEN = np.array([10 ** k for k in range(19)], dtype=np.int64)
+# odd-digit stones above this would overflow int64 when multiplied by 2024
+MAX_MULTIPLIABLE = np.iinfo(np.int64).max // 2024
+
+
+def digit_count(stone: int) -> int:
+    """Number of decimal digits of a non-negative integer, without going through str()."""
+    digits = bisect_right(POWERS_OF_TEN, stone) + 1
+    return digits if digits <= len(POWERS_OF_TEN) else len(str(stone))
+
+
+@lru_cache(maxsize=1 << 16)
+def blink_stone(stone: int) -> Tuple[int, ...]:
+    """
+    The stones a single stone turns into after one blink.
+
+    The memo is bounded: values that stop appearing are evicted, while the
+    small set of recurring values stays cached.
+    """
+    if stone == 0:
+        return (1,)
+    digits = digit_count(stone)
+    if digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[digits // 2 - 1])
+    return (stone * 2024,)
+
+
+def blink_counts(counts: Dict[int, int]) -> Dict[int, int]:
+    """Applies one blink to a {value: multiplicity} histogram."""
+    new_counts = defaultdict(int)
+    for stone, multiplicity in counts.items():
+        for new_stone in blink_stone(stone):
+            new_counts[new_stone] += multiplicity
+    return new_counts
+
+
+def evolve(stones: Iterable[int], blinks: int) -> Dict[int, int]:
+    """
+    Evolves the stones for a number of blinks.
+
+    Parameters:
+        stones (Iterable[int]): The initial stone values.
+        blinks (int): How many times to blink.
+
+    Returns:
+        Dict[int, int]: Multiplicity of every stone value after the last blink.
+    """
+    counts = Counter(int(stone) for stone in stones)
+    for _ in range(blinks):
+        counts = blink_counts(counts)
+    return counts
+
+
+def count_stones(stones: Iterable[int], blinks: int) -> int:
+    """Number of stones after the given number of blinks."""
+    return sum(evolve(stones, blinks).values())
+
+
+def blink_array(stones: np.ndarray) -> np.ndarray:
+    """
+    Applies one blink to an array of stones, keeping their order.
+
+    Digit counts come from a lookup in a power-of-ten table and even-digit
+    stones are split with divmod by the matching power of ten, all on whole
+    int64 arrays. If a multiplication by 2024 would overflow int64 (or the
+    input already is an object array of big ints) the blink falls back to
+    Python ints in an object array, returning to int64 once the values fit again.
+
+    Parameters:
+        stones (np.ndarray): The stones, int64 or object dtype.
+
+    Returns:
+        np.ndarray: The stones after the blink.
+    """
+    if stones.dtype != object:
+        stones = stones.astype(np.int64, copy=False)
+        zero = stones == 0
+        digits = np.searchsorted(INT64_POWERS_OF_TEN, stones, side='right')
+        even = ~zero & (digits % 2 == 0)
+        odd = ~zero & ~even
+
+    if stones.dtype == object or (stones[odd] > MAX_MULTIPLIABLE).any():
+        blinked = [new_stone for stone in stones.tolist() for new_stone in blink_stone(stone)]
+        if not blinked or max(blinked) <= np.iinfo(np.int64).max:
+            return np.array(blinked, dtype=np.int64)
+        return np.array(blinked, dtype=object)
+
+    # an even-digit stone becomes two stones, everything else one
+    sizes = 1 + even
+    start = np.cumsum(sizes) - sizes
+    blinked = np.empty(int(sizes.sum()), dtype=np.int64)
+
+    blinked[start[zero]] = 1
+    blinked[start[odd]] = stones[odd] * 2024
+    left, right = np.divmod(stones[even], INT64_POWERS_OF_TEN[digits[even] // 2])
+    blinked[start[even]] = left
+    blinked[start[even] + 1] = right
+    return blinked
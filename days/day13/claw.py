@@ -0,0 +1,220 @@
+"""
+Closed-form solver for the day 13 claw machines.
+
+Pressing A a times and B b times must land exactly on the prize:
+
+    a * ax + b * bx = px
+    a * ay + b * by = py
+
+When the button vectors are independent (D = ax * by - bx * ay != 0) the
+system has exactly one solution, which Cramer's rule gives directly; it only
+counts if both quotients divide exactly and are non-negative. All machines
+are solved at once on integer arrays, so there is no search at all.
+
+When D == 0 the buttons move along the same line and the prize is reachable
+in infinitely many ways or not at all. Those rare machines are solved one by
+one: the system collapses to a single equation a * u + b * v = w, whose
+non-negative solutions form an arithmetic progression found with the extended
+Euclidean algorithm, and the cheapest one sits at an end of that progression.
+"""
+import re
+from typing import Tuple
+
+import numpy as np
+
+COST_A = 3
+COST_B = 1
+
+MACHINE_PATTERN = re.compile(rb'Button A:\s*X\+(\d+),\s*Y\+(\d+)\s*'
+                             rb'Button B:\s*X\+(\d+),\s*Y\+(\d+)\s*'
+                             rb'Prize:\s*X=(\d+),\s*Y=(\d+)', re.IGNORECASE)
+DIGITS_ONLY = bytes(byte if byte in b'0123456789' else ord(' ') for byte in range(256))
+
+
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    """(g, x, y) with a * x + b * y == g == gcd(a, b) >= 0."""
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    if old_r < 0:
+        return -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _min_cost_on_line(u: int, v: int, w: int, cost_a: int, cost_b: int) -> int:
+    """
+    Cheapest a * cost_a + b * cost_b with a * u + b * v == w and a, b >= 0 integers, or -1.
+
+    Costs must be positive, which keeps the minimum finite.
+    """
+    if u == 0 and v == 0:
+        return 0 if w == 0 else -1
+    g, x, y = extended_gcd(u, v)
+    if w % g:
+        return -1
+
+    # every solution is (a0 + k * step_a, b0 - k * step_b) for integer k
+    a0, b0 = x * (w // g), y * (w // g)
+    step_a, step_b = v // g, u // g
+
+    # a >= 0 and b >= 0 as bounds on k; None means unbounded on that side
+    low, high = None, None
+    for start, step in ((a0, step_a), (b0, -step_b)):
+        # start + k * step >= 0
+        if step > 0:
+            bound = _ceil_div(-start, step)
+            low = bound if low is None else max(low, bound)
+        elif step < 0:
+            bound = start // -step
+            high = bound if high is None else min(high, bound)
+        elif start < 0:
+            return -1
+    if low is not None and high is not None and low > high:
+        return -1
+
+    slope = cost_a * step_a - cost_b * step_b
+    k = low if slope >= 0 else high
+    if k is None:
+        # only reachable with non-positive costs
+        raise ValueError("the token cost has no minimum")
+    return (a0 + k * step_a) * cost_a + (b0 - k * step_b) * cost_b
+
+
+def solve_machine(ax: int, ay: int, bx: int, by: int, px: int, py: int,
+                  cost_a: int = COST_A, cost_b: int = COST_B) -> int:
+    """
+    Minimum tokens to win a single machine.
+
+    Returns:
+        int: Minimum tokens required, or -1 if impossible.
+    """
+    determinant = ax * by - bx * ay
+    if determinant != 0:
+        a_numerator, b_numerator = px * by - bx * py, ax * py - px * ay
+        if a_numerator % determinant or b_numerator % determinant:
+            return -1
+        a, b = a_numerator // determinant, b_numerator // determinant
+        return a * cost_a + b * cost_b if a >= 0 and b >= 0 else -1
+
+    # collinear buttons: the prize must lie on their common line
+    if ax * py - px * ay != 0 or bx * py - px * by != 0:
+        return -1
+    # project onto an axis the line is not perpendicular to; the projection is one-to-one on the line
+    if ax or bx or px:
+        return _min_cost_on_line(ax, bx, px, cost_a, cost_b)
+    return _min_cost_on_line(ay, by, py, cost_a, cost_b)
+
+
+def _parse_well_formed(data: bytes):
+    """
+    Fast path for files where every machine is complete: every non-digit byte
+    becomes a space and NumPy reads the remaining numbers in one pass.
+
+    Returns:
+        np.ndarray: An (n, 6) int64 array, or None if the file needs the checking parser.
+    """
+    lowered = data.lower()
+    machines = lowered.count(b'button a:')
+    if lowered.count(b'button b:') != machines or lowered.count(b'prize:') != machines or b'-' in data:
+        return None
+    digits = data.translate(DIGITS_ONLY)
+    # longest run of digits: 19 or more may not fit in int64
+    spaces = np.flatnonzero(np.frombuffer(b' ' + digits + b' ', dtype=np.uint8) == ord(' '))
+    if spaces.size > 1 and np.diff(spaces).max() > 19:
+        return None
+    values = np.fromstring(digits, dtype=np.int64, sep=' ')
+    return values.reshape(-1, 6) if values.size == 6 * machines else None
+
+
+def _parse_checked(data: bytes) -> np.ndarray:
+    """Matches machine by machine, skipping malformed ones; numbers too long for int64 become Python ints."""
+    fields = MACHINE_PATTERN.findall(data)
+    expected = len(re.findall(rb'Button A:', data, re.IGNORECASE))
+    if len(fields) != expected:
+        print(f"Warning: skipped {expected - len(fields)} malformed or incomplete machines.")
+
+    values = np.array(fields, dtype=np.bytes_).reshape(-1, 6)
+    # the bytes dtype is as wide as the longest number; 19 digits may not fit in int64
+    if values.dtype.itemsize >= 19:
+        return np.array([[int(value) for value in row] for row in fields], dtype=object).reshape(-1, 6)
+    return values.astype(np.int64)
+
+
+def load_machine_arrays(file_path: str, offset: int = 0) -> Tuple[np.ndarray, ...]:
+    """
+    Loads every machine of a data file straight into ax, ay, bx, by, px, py arrays.
+
+    Well-formed files are read by NumPy in a single pass over the bytes; other
+    files go through one precompiled pattern that skips incomplete or malformed
+    machines with a warning. Either way no per-machine objects are built, and
+    the prize offset is added to the prize columns as a single array operation.
+
+    Parameters:
+        file_path (str): The path to the input data file.
+        offset (int): Added to both prize coordinates (10000000000000 for part 2).
+
+    Returns:
+        Tuple[np.ndarray, ...]: int64 arrays, or object arrays of Python ints if the prizes overflow int64.
+    """
+    with open(file_path, 'rb') as file:
+        data = file.read()
+
+    values = _parse_well_formed(data)
+    if values is None:
+        values = _parse_checked(data)
+
+    prizes = values[:, 4:]
+    if offset:
+        if values.dtype != object and (prizes.size == 0 or int(prizes.max()) <= np.iinfo(np.int64).max - offset):
+            prizes += offset
+        else:
+            values = values.astype(object)
+            values[:, 4:] += offset
+    return tuple(values[:, column].copy() for column in range(6))
+
+
+def min_tokens(ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray, px: np.ndarray, py: np.ndarray,
+               cost_a: int = COST_A, cost_b: int = COST_B) -> np.ndarray:
+    """
+    Minimum tokens for every machine at once.
+
+    Parameters:
+        ax, ay, bx, by (np.ndarray): Button A and B movements per machine.
+        px, py (np.ndarray): Prize locations per machine.
+        cost_a, cost_b (int): Tokens per press of A and B.
+
+    Returns:
+        np.ndarray: Tokens per machine, -1 where the prize cannot be won.
+    """
+    columns = [np.asarray(column) for column in (ax, ay, bx, by, px, py)]
+    # the cross products below must not overflow int64; otherwise fall back to Python ints
+    largest_button = max((int(np.abs(c).max()) for c in columns[:4] if c.size), default=0)
+    largest_prize = max((int(np.abs(c).max()) for c in columns[4:] if c.size), default=0)
+    dtype = np.int64 if 2 * largest_button * max(largest_button, largest_prize) < 1 << 63 else object
+    ax, ay, bx, by, px, py = (column.astype(dtype) for column in columns)
+
+    determinant = ax * by - bx * ay
+    a_numerator = px * by - bx * py
+    b_numerator = ax * py - px * ay
+
+    regular = determinant != 0
+    safe = np.where(regular, determinant, 1)
+    solvable = regular & (a_numerator % safe == 0) & (b_numerator % safe == 0)
+    a = np.where(solvable, a_numerator // safe, -1)
+    b = np.where(solvable, b_numerator // safe, -1)
+    solvable &= (a >= 0) & (b >= 0)
+    tokens = np.where(solvable, a * cost_a + b * cost_b, -1)
+
+    for i in np.flatnonzero(~regular):
+        tokens[i] = solve_machine(int(ax[i]), int(ay[i]), int(bx[i]), int(by[i]), int(px[i]), int(py[i]),
+                                  cost_a, cost_b)
+    return tokens
@@ -0,0 +1,20 @@
+from robots import find_easter_egg, load_robots
+
+
+def day14_pt2(file_path: str = 'in.txt', scan: bool = False) -> int:
+    swarm = load_robots(file_path)
+    print(f"Floor: {swarm.width}x{swarm.height}, robots: {len(swarm)}")
+    return find_easter_egg(swarm, scan)
+
+
+# entry points for run.py
+parse = load_robots
+
+
+def solve(swarm):
+    """The first second the robots draw the easter egg picture."""
+    return find_easter_egg(swarm)
+
+
+if __name__ == '__main__':
+    print(day14_pt2('in.txt'))
@@ -0,0 +1,244 @@
+"""
+Closed-form robot movement for day 14.
+
+Robots never interact and the floor wraps around, so a robot's position after
+t seconds is simply (p + v * t) mod (width, height). The swarm evaluates that
+for every robot in one integer array operation; t is reduced modulo the floor
+size first, so t = 100 and t = 10**9 cost the same and nothing overflows.
+
+Robots are kept as four int32 arrays (px, py, vx, vy) rather than complex
+numbers, so all the arithmetic is exact integer modulo.
+"""
+import re
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+ROBOT_PATTERN = re.compile(r'p=(-?\d+),(-?\d+)\s+v=(-?\d+),(-?\d+)')
+PUZZLE_FLOOR = (101, 103)
+EXAMPLE_FLOOR = (11, 7)
+
+
+class RobotSwarm:
+    """
+    All robots on a width x height floor, as arrays of start positions and velocities.
+
+    Coordinates are x (column, 0..width-1) and y (row, 0..height-1).
+    """
+
+    def __init__(self, px: np.ndarray, py: np.ndarray, vx: np.ndarray, vy: np.ndarray, width: int, height: int):
+        self.px = np.asarray(px, dtype=np.int32)
+        self.py = np.asarray(py, dtype=np.int32)
+        self.vx = np.asarray(vx, dtype=np.int32)
+        self.vy = np.asarray(vy, dtype=np.int32)
+        self.width = width
+        self.height = height
+
+    def __len__(self) -> int:
+        return len(self.px)
+
+    def positions(self, t: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions of every robot after t seconds.
+
+        Parameters:
+            t (int): Seconds elapsed; any non-negative integer.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The x and y coordinates, wrapped onto the floor.
+        """
+        # int64 intermediates: v * (t mod size) can exceed int32 on large floors
+        x = (self.px + self.vx.astype(np.int64) * (t % self.width)) % self.width
+        y = (self.py + self.vy.astype(np.int64) * (t % self.height)) % self.height
+        return x.astype(np.int32), y.astype(np.int32)
+
+    def positions_at(self, times: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions of every robot at several times at once.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: x and y coordinates, shape (len(times), robots).
+        """
+        times = np.asarray(times, dtype=np.int64).reshape(-1, 1)
+        x = (self.px + self.vx.astype(np.int64) * (times % self.width)) % self.width
+        y = (self.py + self.vy.astype(np.int64) * (times % self.height)) % self.height
+        return x.astype(np.int32), y.astype(np.int32)
+
+
+def load_robots(file_path: str, width: Optional[int] = None, height: Optional[int] = None) -> RobotSwarm:
+    """
+    Parses "p=x,y v=dx,dy" lines into a swarm on a width x height floor.
+
+    Lines that do not match are reported and skipped.
+
+    Parameters:
+        file_path (str): Path to the input data file.
+        width (int): Floor width (101 for the puzzle, 11 for the example).
+        height (int): Floor height (103 for the puzzle, 7 for the example).
+            Without a size, the example floor is used if every robot starts on it, the puzzle floor otherwise.
+
+    Returns:
+        RobotSwarm: The robots, with positions and velocities wrapped onto the floor.
+    """
+    rows = []
+    with open(file_path, 'r') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            match = ROBOT_PATTERN.match(line)
+            if match:
+                rows.append(match.groups())
+            else:
+                print(f"Line {line_number} doesn't match the expected format: {line}")
+
+    values = np.array(rows, dtype=np.int64).reshape(-1, 4)
+    if width is None or height is None:
+        fits_example = len(values) == 0 or (values[:, 0].max() < EXAMPLE_FLOOR[0] and values[:, 1].max() < EXAMPLE_FLOOR[1])
+        width, height = EXAMPLE_FLOOR if fits_example else PUZZLE_FLOOR
+    # velocities only matter modulo the floor size, which also keeps them small
+    return RobotSwarm(values[:, 0] % width, values[:, 1] % height, values[:, 2] % width, values[:, 3] % height,
+                      width, height)
+
+
+def _count_per_frame(index: np.ndarray, bins: int) -> np.ndarray:
+    """
+    np.bincount applied to every row of an (..., robots) array of bin indices in a single call,
+    by offsetting each row into its own range of bins.
+    """
+    index = np.asarray(index, dtype=np.int64)
+    frames = index.reshape(int(np.prod(index.shape[:-1])), index.shape[-1])
+    offsets = np.arange(len(frames), dtype=np.int64)[:, None] * bins
+    counts = np.bincount((frames + offsets).ravel(), minlength=len(frames) * bins)
+    return counts.reshape(index.shape[:-1] + (bins,))
+
+
+def occupancy_grid(positions: Tuple[np.ndarray, np.ndarray], width: int, height: int) -> np.ndarray:
+    """
+    Number of robots on every tile.
+
+    Parameters:
+        positions (Tuple[np.ndarray, np.ndarray]): x and y coordinates, shape (robots,) or (times, robots).
+        width (int): Floor width.
+        height (int): Floor height.
+
+    Returns:
+        np.ndarray: Counts of shape (height, width), or (times, height, width) for a batch.
+    """
+    x, y = (np.asarray(coordinate, dtype=np.int64) for coordinate in positions)
+    counts = _count_per_frame(y * width + x, width * height)
+    return counts.reshape(counts.shape[:-1] + (height, width))
+
+
+def quadrant_counts(positions: Tuple[np.ndarray, np.ndarray], width: int, height: int) -> np.ndarray:
+    """
+    Robots in the top-left, top-right, bottom-left and bottom-right quadrants; robots on
+    a middle line (odd floor sizes only) belong to none.
+
+    Returns:
+        np.ndarray: Counts of shape (4,), or (times, 4) for a batch.
+    """
+    x, y = (np.asarray(coordinate, dtype=np.int64) for coordinate in positions)
+    quadrant = (x >= (width + 1) // 2) + 2 * (y >= (height + 1) // 2)
+    quadrant[(x == width // 2) & (width % 2 == 1) | (y == height // 2) & (height % 2 == 1)] = 4
+    return _count_per_frame(quadrant, 5)[..., :4]
+
+
+def safety_factor(positions: Tuple[np.ndarray, np.ndarray], width: int, height: int):
+    """
+    Product of the robot counts in the four quadrants.
+
+    Parameters:
+        positions (Tuple[np.ndarray, np.ndarray]): x and y coordinates, shape (robots,) or (times, robots).
+        width (int): Floor width.
+        height (int): Floor height.
+
+    Returns:
+        int for a single frame, np.ndarray with one factor per time for a batch.
+    """
+    counts = quadrant_counts(positions, width, height)
+    # past ~200k robots the product of four counts can overflow int64
+    if counts.size and counts.max() > 50_000:
+        counts = counts.astype(object)
+    factors = counts.prod(axis=-1)
+    return int(factors) if factors.ndim == 0 else factors
+
+
+def frame_statistics(swarm: RobotSwarm, times: Sequence[int]) -> Dict[str, np.ndarray]:
+    """
+    Scores frames for how much the robots cluster, all frames of a batch at once.
+
+    Returns:
+        Dict[str, np.ndarray]: Per time: 'safety_factor' (product of the robot counts in the four
+        quadrants), 'x_variance' and 'y_variance' of the positions, and 'overlaps' (robots sharing
+        a tile with an earlier robot; 0 when every robot stands alone).
+    """
+    positions = swarm.positions_at(times)
+    x, y = positions
+    grid = occupancy_grid(positions, swarm.width, swarm.height)
+    occupied = np.count_nonzero(grid.reshape(len(grid), -1), axis=1)
+
+    return {
+        'safety_factor': safety_factor(positions, swarm.width, swarm.height),
+        'x_variance': x.var(axis=1),
+        'y_variance': y.var(axis=1),
+        'overlaps': x.shape[1] - occupied,
+    }
+
+
+def chinese_remainder(a: int, m: int, b: int, n: int) -> int:
+    """
+    The smallest t >= 0 with t = a (mod m) and t = b (mod n).
+
+    Raises:
+        ValueError: If the two congruences contradict each other.
+    """
+    # extended Euclid for m * p + n * q = g
+    old_r, r, old_p, p = m, n, 1, 0
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_p, p = p, old_p - quotient * p
+    g = old_r
+    if (b - a) % g:
+        raise ValueError("the congruences have no common solution")
+    lcm = m // g * n
+    return (a + (b - a) // g * old_p % (n // g) * m) % lcm
+
+
+def find_easter_egg(swarm: RobotSwarm, scan: bool = False, batch_size: int = 256) -> int:
+    """
+    The first time the robots gather into a picture.
+
+    x positions repeat every width seconds and y positions every height
+    seconds, independently. The picture is the moment both coordinates are
+    most concentrated, so the time with the smallest x variance among the
+    first width frames and the one with the smallest y variance among the
+    first height frames pin it down modulo width and height, and the Chinese
+    remainder theorem combines them: width + height frames in total.
+
+    Parameters:
+        swarm (RobotSwarm): The robots.
+        scan (bool): Score every frame in [0, width * height) instead, taking the one with the
+            fewest robots sharing a tile and, among those, the smallest variance.
+        batch_size (int): Frames scored together when scanning.
+
+    Returns:
+        int: The time of the picture.
+    """
+    width, height = swarm.width, swarm.height
+    if not scan:
+        x, _ = swarm.positions_at(range(width))
+        _, y = swarm.positions_at(range(height))
+        return chinese_remainder(int(x.var(axis=1).argmin()), width, int(y.var(axis=1).argmin()), height)
+
+    best_time, best_key = 0, None
+    for start in range(0, width * height, batch_size):
+        times = np.arange(start, min(start + batch_size, width * height))
+        statistics = frame_statistics(swarm, times)
+        spread = statistics['x_variance'] + statistics['y_variance']
+        order = np.lexsort((spread, statistics['overlaps']))
+        key = (int(statistics['overlaps'][order[0]]), float(spread[order[0]]))
+        if best_key is None or key < best_key:
+            best_time, best_key = int(times[order[0]]), key
+    return best_time
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from towels import TowelMatcher, solve_designs
 
 
 def read_input(file='test.txt'):
@@ -9,32 +9,23 @@ def read_input(file='test.txt'):
         _ = f.readline()
 
         for line in f:
-            needed_combinations.append(line.strip())
+            # a trailing blank line is not a design
+            if line.strip():
+                needed_combinations.append(line.strip())
 
     return tuple(avaible_towels), needed_combinations
 
 
-@lru_cache(maxsize=None)
 def can_be_arranged(towels, c):
-
-    for i in range(0,len(c)):
-       # check if any word from towels is a substring in c a starting at cursor
-        for t in towels:
-            if c[i:] == t:
-                return True
-            if c[i:].startswith(t):
-                #print(f"matched {t} in {c[i:]}")
-                match = can_be_arranged(towels, c[len(t):])
-                if match:
-                    return True
-
-        return False
+    """Whether the design can be built from the towels."""
+    return TowelMatcher(towels).possible(c)
 
 
 def dfs_combinations(towels, comb):
-
+    # the towels are indexed once and shared by every design
+    matcher = TowelMatcher(towels)
     for c in comb:
-        yield can_be_arranged(towels, c)
+        yield matcher.possible(c)
 
 
 
@@ -57,6 +48,16 @@ def debug(c):
     print(towels, c)
     print(can_be_arranged(towels, c))
 
+
+# entry points for run.py
+parse = read_input
+
+
+def solve(data, max_workers=None):
+    towels, comb = data
+    return sum(solve_designs(towels, comb, count=False, max_workers=max_workers))
+
+
 if __name__ == '__main__':
     day19_pt1()
     #debug('bwurrg')
@@ -0,0 +1,292 @@
+"""
+Towel pattern index for day 19.
+
+The available towels are stored in a trie, so finding every towel that
+matches a design at some offset is a single walk down the trie that stops at
+the first mismatching stripe, instead of a startswith() per towel. Designs
+are then solved with a DP over integer offsets, so the cost of a design is
+proportional to its length times the longest towel, whatever the number of
+towels. TowelMatcher bundles the index with the DP for a fixed towel set, and
+solve_designs spreads large batches of designs over worker processes.
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# two reduced counts below this add up without overflowing int64
+MAX_REDUCED = 1 << 62
+
+
+class TowelIndex:
+    """
+    A trie over the towel patterns.
+
+    Node 0 is the root; children[node] maps a stripe colour to the next node
+    and terminal[node] marks that the path to node spells a whole towel.
+    """
+
+    def __init__(self, towels: Iterable[str]):
+        self.children: List[Dict[str, int]] = [{}]
+        self.terminal: List[bool] = [False]
+        for towel in towels:
+            if towel:
+                self.add(towel)
+
+    def add(self, towel: str) -> None:
+        node = 0
+        for stripe in towel:
+            child = self.children[node].get(stripe)
+            if child is None:
+                child = len(self.children)
+                self.children[node][stripe] = child
+                self.children.append({})
+                self.terminal.append(False)
+            node = child
+        self.terminal[node] = True
+
+    def match_ends(self, design: str, start: int) -> List[int]:
+        """Offsets just past every towel that matches design at start."""
+        children, terminal = self.children, self.terminal
+        ends = []
+        node = 0
+        for end in range(start, len(design)):
+            node = children[node].get(design[end])
+            if node is None:
+                break
+            if terminal[node]:
+                ends.append(end + 1)
+        return ends
+
+
+def check_count_mode(modulus: Optional[int], cap: Optional[int]) -> None:
+    """
+    Validates the options for reduced counts.
+
+    Raises:
+        ValueError: If both are given, or either is out of the range where int64 sums stay exact.
+    """
+    if modulus is not None and cap is not None:
+        raise ValueError("use either a modulus or a cap, not both")
+    if modulus is not None and not 1 < modulus <= MAX_REDUCED:
+        raise ValueError(f"modulus must be between 2 and {MAX_REDUCED}")
+    if cap is not None and not 0 < cap <= MAX_REDUCED:
+        raise ValueError(f"cap must be between 1 and {MAX_REDUCED}")
+
+
+class SuffixCache:
+    """A size-bounded {design suffix: result} map that evicts the least recently used entry."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: 'OrderedDict[str, object]' = OrderedDict()
+
+    def get(self, suffix: str):
+        result = self.entries.get(suffix)
+        if result is not None:
+            self.entries.move_to_end(suffix)
+        return result
+
+    def put(self, suffix: str, result) -> None:
+        self.entries[suffix] = result
+        self.entries.move_to_end(suffix)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+class TowelMatcher:
+    """
+    Solves designs against one fixed set of towels.
+
+    The towels are indexed once when the matcher is built; every design then
+    gets its own DP array over integer offsets, which is dropped as soon as
+    the design is solved, so memory does not grow with the number of designs.
+
+    With cache_size > 0 the results for design suffixes are also kept in a
+    bounded LRU cache shared by all designs, which pays off when many designs
+    repeat or share long endings.
+
+    Counts are exact by default. Given a modulus they are reduced modulo it,
+    given a cap they saturate at it, so they stay machine-size integers.
+    """
+
+    def __init__(self, towels: Iterable[str], cache_size: int = 0,
+                 modulus: Optional[int] = None, cap: Optional[int] = None):
+        check_count_mode(modulus, cap)
+        self.towels = tuple(towels)
+        self.index = TowelIndex(self.towels)
+        self.modulus = modulus
+        self.cap = cap
+        self.count_cache = SuffixCache(cache_size) if cache_size > 0 else None
+        self.possible_cache = SuffixCache(cache_size) if cache_size > 0 else None
+
+    def count(self, design: str) -> int:
+        """Number of ways to build the design from the towels, reduced or capped as configured."""
+        return self._solve(design, 0, 1, self._combine_counts, self.count_cache)
+
+    def possible(self, design: str) -> bool:
+        """Whether the design can be built from the towels at all."""
+        return self._solve(design, False, True, any, self.possible_cache)
+
+    def _combine_counts(self, counts: Iterable[int]) -> int:
+        total = sum(counts)
+        if self.modulus is not None:
+            return total % self.modulus
+        if self.cap is not None:
+            return min(total, self.cap)
+        return total
+
+    def _solve(self, design: str, empty, complete, combine: Callable, cache: Optional[SuffixCache]):
+        """
+        DP from the end of the design: table[start] combines table[end] over every
+        towel that covers design[start:end]. An empty design is not buildable.
+        """
+        if not design:
+            return empty
+        if cache is not None:
+            cached = cache.get(design)
+            if cached is not None:
+                return cached
+
+        match_ends = self.index.match_ends
+        table = [empty] * (len(design) + 1)
+        table[len(design)] = complete
+        for start in range(len(design) - 1, -1, -1):
+            cached = cache.get(design[start:]) if cache is not None else None
+            if cached is None:
+                cached = combine(table[end] for end in match_ends(design, start))
+                if cache is not None:
+                    cache.put(design[start:], cached)
+            table[start] = cached
+        return table[0]
+
+
+_worker_matcher: Optional[TowelMatcher] = None
+
+
+def init_worker(matcher: TowelMatcher) -> None:
+    """Process-pool initializer: keeps the shipped matcher, so the towel index crosses over once per worker."""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def count_chunk(designs: List[str]) -> List[int]:
+    """Arrangement counts for a chunk of designs, using the matcher installed by init_worker."""
+    return [_worker_matcher.count(design) for design in designs]
+
+
+def possible_chunk(designs: List[str]) -> List[bool]:
+    """Which designs of a chunk can be built, using the matcher installed by init_worker."""
+    return [_worker_matcher.possible(design) for design in designs]
+
+
+def solve_designs(towels: Iterable[str], designs: Sequence[str], count: bool = True,
+                  max_workers: Optional[int] = None, chunk_size: int = 1024,
+                  modulus: Optional[int] = None, cap: Optional[int] = None) -> list:
+    """
+    Solves a batch of designs against one towel set, in parallel.
+
+    The towel index is built once here and handed to each worker through the
+    pool initializer; the workers then only receive chunks of designs.
+
+    Parameters:
+        towels (Iterable[str]): The available towel patterns.
+        designs (Sequence[str]): The designs to build.
+        count (bool): True for arrangement counts (part 2), False for whether each design is possible (part 1).
+        max_workers (int): Worker processes; defaults to the CPU count, 1 solves in this process.
+        chunk_size (int): Designs sent to a worker per task.
+        modulus (int): Reduce counts modulo this; None keeps them exact.
+        cap (int): Saturate counts at this instead.
+
+    Returns:
+        list: One result per design, in input order.
+    """
+    matcher = TowelMatcher(towels, modulus=modulus, cap=cap)
+    solve_chunk = count_chunk if count else possible_chunk
+    chunks = [designs[i:i + chunk_size] for i in range(0, len(designs), chunk_size)]
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers == 1 or len(chunks) < 2:
+        # a single chunk is not worth starting a pool for
+        init_worker(matcher)
+        results = map(solve_chunk, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(matcher,)) as executor:
+            results = list(executor.map(solve_chunk, chunks))
+
+    return [result for chunk in results for result in chunk]
+
+
+def count_designs_array(towels: Iterable[str], designs: Sequence[str],
+                        modulus: Optional[int] = None, cap: Optional[int] = None) -> np.ndarray:
+    """
+    Arrangement counts for a whole batch of designs at once, vectorised over the designs.
+
+    Designs are padded into one matrix of stripe codes. For every towel length
+    the windows of that length are encoded as base-(alphabet + 2) integers and
+    looked up among the towels with np.isin; the DP then walks the offsets from
+    the end, updating that offset for every design in one array operation per
+    towel length. Padding has code 0, which no towel contains, so windows that
+    run past the end of a design never match.
+
+    Parameters:
+        towels (Iterable[str]): The available towel patterns.
+        designs (Sequence[str]): The designs to build.
+        modulus (int): Reduce counts modulo this, keeping them in int64.
+        cap (int): Saturate counts at this instead.
+
+    Returns:
+        np.ndarray: One count per design; int64 when reduced or capped, exact Python ints (object dtype) otherwise.
+    """
+    check_count_mode(modulus, cap)
+    towels = [towel for towel in towels if towel]
+    exact = modulus is None and cap is None
+    dtype = object if exact else np.int64
+    counts = np.zeros(len(designs), dtype=dtype)
+    if not designs or not towels:
+        return counts
+
+    alphabet = {stripe: code for code, stripe in enumerate(sorted(set(''.join(towels))), start=1)}
+    # stripes no towel uses share the top digit, so they can never be matched
+    unknown = len(alphabet) + 1
+    base = len(alphabet) + 2
+    by_length: Dict[int, List[int]] = {}
+    for towel in towels:
+        key = 0
+        for stripe in towel:
+            key = key * base + alphabet[stripe]
+        by_length.setdefault(len(towel), []).append(key)
+    if base ** max(by_length) > np.iinfo(np.int64).max:
+        raise ValueError("towels are too long to encode in int64 windows")
+
+    width = max(len(design) for design in designs)
+    codes = np.zeros((len(designs), width + max(by_length)), dtype=np.int64)
+    for row, design in enumerate(designs):
+        codes[row, :len(design)] = [alphabet.get(stripe, unknown) for stripe in design]
+
+    matches = {}
+    for length, keys in by_length.items():
+        windows = np.zeros((len(designs), width), dtype=np.int64)
+        for offset in range(length):
+            windows = windows * base + codes[:, offset:offset + width]
+        matches[length] = np.isin(windows, np.array(keys, dtype=np.int64))
+
+    lengths = np.array([len(design) for design in designs])
+    ways = np.zeros((len(designs), width + max(by_length) + 1), dtype=dtype)
+    # an empty design is not buildable, so it gets no starting way
+    nonempty = np.flatnonzero(lengths)
+    ways[nonempty, lengths[nonempty]] = 1
+    for start in range(width - 1, -1, -1):
+        total = ways[:, start]
+        for length, match in matches.items():
+            total = total + np.where(match[:, start], ways[:, start + length], 0)
+            if modulus is not None:
+                total %= modulus
+            elif cap is not None:
+                np.minimum(total, cap, out=total)
+        ways[:, start] = total
+
+    counts[:] = ways[:, 0]
+    return counts
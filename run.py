@@ -0,0 +1,212 @@
+"""
+Runs every days/dayNN/pt*.py solution against a chosen input and reports
+parse/solve wall time, peak RSS and the answer for each part.
+
+A solution takes part when its module exposes two entry points:
+
+    parse(file_path) -> data
+    solve(data) -> answer
+
+Each part runs in a fresh process so that module level caches, peak RSS and a
+runaway solver (see --timeout) do not leak into the next one.
+
+Usage:
+    python run.py                     # every day, puzzle input
+    python run.py 6 7 --input test    # day06 and day07 against test.txt
+    python run.py 11 --part pt2 --json results.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+DAYS_DIR = Path(__file__).resolve().parent / 'days'
+
+
+@dataclass
+class PartResult:
+    day: str
+    part: str
+    status: str  # ok, skipped, error or timeout
+    parse_time: Optional[float] = None
+    solve_time: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    answer: Optional[str] = None
+    message: str = ''
+
+
+def discover_parts(days: Optional[List[int]] = None, parts: Optional[List[str]] = None) -> List[Path]:
+    """
+    Finds the solution modules under days/, sorted by day and part.
+
+    Parameters:
+        days (List[int]): Only keep these day numbers (all when empty).
+        parts (List[str]): Only keep these part names, e.g. 'pt1' or 'pt2_2' (all when empty).
+
+    Returns:
+        List[Path]: Paths to the matching pt*.py files.
+    """
+    found = []
+    for path in sorted(DAYS_DIR.glob('day[0-9]*/pt*.py')):
+        day_number = int(path.parent.name[3:])
+        if days and day_number not in days:
+            continue
+        if parts and path.stem not in parts:
+            continue
+        found.append(path)
+    return found
+
+
+def resolve_input(day_dir: Path, name: str) -> Optional[Path]:
+    """
+    Maps an --input value to a file for the given day.
+
+    'in' and 'test' are looked up inside the day directory (day01/day02 keep
+    their puzzle input in dayNN_input.txt), anything else is treated as a path.
+    """
+    candidates = [Path(name), day_dir / name, day_dir / f'{name}.txt']
+    if name in ('in', 'in.txt'):
+        candidates.append(day_dir / f'{day_dir.name}_input.txt')
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def load_module(path: Path):
+    """Imports a solution file by path, with its day directory importable for local helpers."""
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(f'{path.parent.name}_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process or of any worker process it has waited for,
+    whichever is larger, so parts that solve in a process pool are not under-reported.
+    """
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_in_child(path: str, input_path: str, conn) -> None:
+    path = Path(path)
+    result = PartResult(path.parent.name, path.stem, 'ok')
+    try:
+        os.chdir(path.parent)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            module = load_module(path)
+            parse, solve = getattr(module, 'parse', None), getattr(module, 'solve', None)
+            if parse is None or solve is None:
+                result.status = 'skipped'
+                result.message = 'no parse/solve entry point'
+            else:
+                start = time.perf_counter()
+                data = parse(input_path)
+                result.parse_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                answer = solve(data)
+                result.solve_time = time.perf_counter() - start
+                result.answer = str(answer)
+    except Exception as exc:
+        result.status = 'error'
+        result.message = f'{type(exc).__name__}: {exc}'
+    result.peak_rss_mb = peak_rss_mb()
+    conn.send(result)
+    conn.close()
+
+
+def run_part(path: Path, input_path: Path, timeout: Optional[float] = None) -> PartResult:
+    """
+    Parses and solves one part in a separate process.
+
+    Parameters:
+        path (Path): The pt*.py solution file.
+        input_path (Path): The input file handed to parse().
+        timeout (float): Seconds before the child is killed, None to wait forever.
+
+    Returns:
+        PartResult: Timings, peak RSS and answer of the part.
+    """
+    ctx = mp.get_context('spawn')
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_run_in_child, args=(str(path), str(input_path), sender))
+    process.start()
+    sender.close()
+
+    result = None
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            pass
+    if result is None:
+        timed_out = process.is_alive()
+        process.kill()
+        process.join()
+        result = PartResult(path.parent.name, path.stem, 'timeout' if timed_out else 'error',
+                            message=f'exceeded {timeout}s' if timed_out else f'exit code {process.exitcode}')
+    process.join()
+    return result
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    return '-' if seconds is None else f'{seconds * 1000:.1f} ms'
+
+
+def print_header() -> None:
+    header = f"{'day':<6} {'part':<6} {'parse':>12} {'solve':>12} {'peak RSS':>10}  answer"
+    print(header)
+    print('-' * len(header))
+
+
+def print_row(r: PartResult) -> None:
+    rss = '-' if r.peak_rss_mb is None else f'{r.peak_rss_mb:.1f} MB'
+    answer = r.answer if r.status == 'ok' else f'[{r.status}] {r.message}'
+    print(f'{r.day:<6} {r.part:<6} {format_seconds(r.parse_time):>12} {format_seconds(r.solve_time):>12} '
+          f'{rss:>10}  {answer}', flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Run and time the Advent of Code 2024 solutions.')
+    parser.add_argument('days', nargs='*', type=int, help='day numbers to run (default: all)')
+    parser.add_argument('--part', action='append', help="part module to run, e.g. pt1, pt2 or pt2_2 (repeatable)")
+    parser.add_argument('--input', default='in',
+                        help="'in' (default), 'test' or a path to an input file")
+    parser.add_argument('--timeout', type=float, default=None, help='seconds allowed per part')
+    parser.add_argument('--json', metavar='PATH', help='also write the results as JSON')
+    args = parser.parse_args(argv)
+
+    print_header()
+    results = []
+    for path in discover_parts(args.days, args.part):
+        input_path = resolve_input(path.parent, args.input)
+        if input_path is None:
+            result = PartResult(path.parent.name, path.stem, 'skipped', message=f'no input {args.input!r}')
+        else:
+            result = run_part(path, input_path, args.timeout)
+        results.append(result)
+        print_row(result)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump([asdict(r) for r in results], file, indent=2)
+
+    return 0 if all(r.status in ('ok', 'skipped') for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())